@@ -33,6 +33,8 @@ if "KOLIBRI_HOME" in os.environ:
 else:
     KOLIBRI_HOME_PATH = DEFAULT_KOLIBRI_HOME_PATH
 
+KOLIBRI_HOME_POSIX = KOLIBRI_HOME_PATH.as_posix()
+
 
 def init_gettext():
     gettext.bindtextdomain(config.GETTEXT_PACKAGE, config.LOCALE_DIR)
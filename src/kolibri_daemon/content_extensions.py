@@ -97,6 +97,11 @@ class ContentExtensionsList(object):
     def __len__(self):
         return len(self.__extensions)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ContentExtensionsList):
+            return NotImplemented
+        return self.__extensions == other.__extensions
+
     @staticmethod
     def compare(
         old: ContentExtensionsList, new: ContentExtensionsList
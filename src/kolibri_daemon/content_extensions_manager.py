@@ -44,6 +44,12 @@ class ContentExtensionsManager(object):
 
         self.__active_extensions.update_kolibri_environ(environ)
 
+        if self.__cached_extensions == self.__active_extensions:
+            # Writing the cache reads content.json from every extension, so
+            # avoid doing that if nothing has changed.
+            logger.debug("Extensions: no changes since last run")
+            return True
+
         logger.info("Updating content extensions...")
 
         success = all(
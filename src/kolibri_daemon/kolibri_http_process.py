@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
+import typing
 from enum import auto
 from enum import Enum
+from urllib.parse import SplitResult
+from urllib.parse import urlsplit
 
 from kolibri.dist.magicbus import ProcessBus
 from kolibri.dist.magicbus.plugins import SimplePlugin
-from kolibri_app.globals import KOLIBRI_HOME_PATH
+from kolibri_app.globals import KOLIBRI_HOME_POSIX
 
 from .kolibri_service_context import KolibriServiceContext
 from .kolibri_service_context import KolibriServiceProcess
@@ -15,6 +18,18 @@ from .kolibri_utils import init_kolibri
 
 logger = logging.getLogger(__name__)
 
+# Kolibri's get_urls function, which can only be imported after Kolibri has
+# been initialized. We keep a reference to it so it does not need to be
+# imported each time Kolibri starts serving.
+_get_urls: typing.Optional[typing.Callable] = None
+
+# The first URL returned by get_urls, and its host part. Finding the host
+# involves listing the system's network addresses, so it is found once for
+# whichever of SERVING or ZIP_SERVING happens first, and reused for the other
+# until Kolibri stops.
+_kolibri_url_tuple: typing.Optional[SplitResult] = None
+_kolibri_url_host: typing.Optional[str] = None
+
 
 class KolibriHttpProcess(KolibriServiceProcess):
     """
@@ -23,11 +38,13 @@ class KolibriHttpProcess(KolibriServiceProcess):
     according to Kolibri's state.
     """
 
+    __slots__ = ("__command_rx", "__keep_alive", "__commands", "__kolibri_bus")
+
     PROCESS_NAME: str = "kolibri-daemon-http"
 
     __command_rx: multiprocessing.connection.Connection
     __keep_alive: bool
-    __commands: dict
+    __commands: typing.Tuple[typing.Callable[[], None], ...]
 
     __kolibri_bus: ProcessBus
 
@@ -42,20 +59,26 @@ class KolibriHttpProcess(KolibriServiceProcess):
         super().__init__(*args, **kwargs)
         self.__command_rx = command_rx
         self.__keep_alive = True
-        self.__commands = {
-            self.Command.START_KOLIBRI: self.__start_kolibri,
-            self.Command.STOP_KOLIBRI: self.__stop_kolibri,
-            self.Command.SHUTDOWN: self.__shutdown,
-        }
+        # Command handlers, in the same order as the values of Command
+        self.__commands = (
+            self.__start_kolibri,
+            self.__stop_kolibri,
+            self.__shutdown,
+        )
 
     def run(self):
+        global _get_urls
+
         super().run()
 
         init_kolibri()
 
         from kolibri.utils.conf import OPTIONS
+        from kolibri.utils.server import get_urls
         from kolibri.utils.server import KolibriProcessBus
 
+        _get_urls = get_urls
+
         self.__update_kolibri_context()
 
         self.__kolibri_bus = KolibriProcessBus(
@@ -70,34 +93,39 @@ class KolibriHttpProcess(KolibriServiceProcess):
         self.context.is_bus_ready = True
 
         while self.__keep_alive:
-            if not self.__run_next_command(timeout=5):
+            if not self.__run_next_commands(timeout=5):
                 self.__shutdown()
 
-    def __run_next_command(self, timeout: int) -> bool:
+    def __run_next_commands(self, timeout: int) -> bool:
+        # Wait for a command, then run any other commands which are already
+        # waiting before we return.
         has_next = self.__command_rx.poll(timeout)
 
-        if not has_next:
-            return True
+        while has_next:
+            try:
+                command_bytes = self.__command_rx.recv_bytes()
+            except EOFError:
+                return False
 
-        try:
-            command = self.__command_rx.recv()
-        except EOFError:
-            return False
+            # Each byte is the value of a KolibriHttpProcess.Command
+            for command_value in command_bytes:
+                try:
+                    self.__run_command(command_value)
+                except ValueError:
+                    return False
 
-        try:
-            self.__run_command(command)
-        except ValueError:
-            return False
+                if not self.__keep_alive:
+                    return True
 
-        return True
+            has_next = self.__command_rx.poll(0)
 
-    def __run_command(self, command: KolibriHttpProcess.Command):
-        fn = self.__commands.get(command, None)
+        return True
 
-        if not callable(fn):
-            raise ValueError("Unknown command '{}'".format(command))
+    def __run_command(self, command_value: int):
+        if not 0 < command_value <= len(self.__commands):
+            raise ValueError("Unknown command '{}'".format(command_value))
 
-        return fn()
+        return self.__commands[command_value - 1]()
 
     def __start_kolibri(self):
         if _process_bus_has_transition(self.__kolibri_bus, "START"):
@@ -129,14 +157,14 @@ class KolibriHttpProcess(KolibriServiceProcess):
 
     def __update_kolibri_context(self):
         import kolibri
-        from kolibri.core.device.models import DeviceAppKey
 
-        self.context.app_key = DeviceAppKey.get_app_key()
-        self.context.kolibri_home = KOLIBRI_HOME_PATH.as_posix()
+        self.context.kolibri_home = KOLIBRI_HOME_POSIX
         self.context.kolibri_version = kolibri.__version__
 
 
 class _KolibriDaemonPlugin(SimplePlugin):
+    __slots__ = ("bus", "__context")
+
     __context: KolibriServiceContext
 
     def __init__(self, bus: ProcessBus, context: KolibriServiceContext):
@@ -148,21 +176,20 @@ class _KolibriDaemonPlugin(SimplePlugin):
         return self.__context
 
     def SERVING(self, port: int):
-        from kolibri.utils.server import get_urls
-
-        _, base_urls = get_urls(listen_port=port)
+        # Kolibri's models are ready by the time it is serving, and clients
+        # only need the app key along with base_url.
+        from kolibri.core.device.models import DeviceAppKey
 
-        self.context.base_url = base_urls[0]
-        self.context.start_error = self.context.StartError.NONE
-        self.context.is_started = True
-        self.context.is_starting = False
+        self.context.update(
+            app_key=DeviceAppKey.get_app_key(),
+            base_url=_get_kolibri_url(port),
+            start_error=self.context.StartError.NONE,
+            is_started=True,
+            is_starting=False,
+        )
 
     def ZIP_SERVING(self, zip_port: int):
-        from kolibri.utils.server import get_urls
-
-        _, zip_urls = get_urls(listen_port=zip_port)
-
-        self.context.extra_url = zip_urls[0]
+        self.context.extra_url = _get_kolibri_url(zip_port)
 
     def START_ERROR(self, error_class, error, traceback):
         # TODO: We could report different types of errors here.
@@ -173,11 +200,57 @@ class _KolibriDaemonPlugin(SimplePlugin):
         logger.error(f"Kolibri failed to start due to an error: {error}")
 
     def STOP(self):
-        self.context.base_url = ""
-        self.context.extra_url = ""
-        self.context.is_starting = False
-        self.context.is_started = False
-        self.context.is_stopped = True
+        _clear_kolibri_url()
+
+        self.context.update(
+            base_url="",
+            extra_url="",
+            is_starting=False,
+            is_started=False,
+        )
+
+
+def _get_kolibri_url(port: int) -> str:
+    global _kolibri_url_tuple
+    global _kolibri_url_host
+
+    if _kolibri_url_tuple and _kolibri_url_host:
+        return _kolibri_url_tuple._replace(
+            netloc=f"{_kolibri_url_host}:{port}"
+        ).geturl()
+
+    _, urls = _kolibri_get_urls(listen_port=port)
+    _kolibri_url_tuple, _kolibri_url_host = _split_kolibri_url(urls[0])
+    return urls[0]
+
+
+def _clear_kolibri_url():
+    global _kolibri_url_tuple
+    global _kolibri_url_host
+
+    _kolibri_url_tuple = None
+    _kolibri_url_host = None
+
+
+def _split_kolibri_url(
+    url: str,
+) -> typing.Tuple[typing.Optional[SplitResult], typing.Optional[str]]:
+    url_tuple = urlsplit(url)
+
+    try:
+        url_port = url_tuple.port
+    except ValueError:
+        return None, None
+
+    if url_port is None:
+        return None, None
+
+    return url_tuple, url_tuple.netloc.rpartition(":")[0]
+
+
+def _kolibri_get_urls(**kwargs) -> typing.Tuple[typing.Any, typing.List[str]]:
+    assert _get_urls, "Kolibri must be initialized before calling get_urls"
+    return _get_urls(**kwargs)
 
 
 def _process_bus_has_transition(bus: ProcessBus, to_state: str) -> bool:
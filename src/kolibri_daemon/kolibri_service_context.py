@@ -21,6 +21,7 @@ class KolibriServiceContext(object):
     KOLIBRI_HOME_LENGTH: int = 4096
 
     __changed_event: multiprocessing.synchronize.Event
+    __is_updating: bool
 
     __is_bus_ready_value: multiprocessing.sharedctypes.Synchronized[c_bool]
     __is_bus_ready_set_event: multiprocessing.synchronize.Event
@@ -60,6 +61,7 @@ class KolibriServiceContext(object):
 
     def __init__(self):
         self.__changed_event = multiprocessing.Event()
+        self.__is_updating = False
 
         self.__is_bus_ready_value = multiprocessing.Value(c_bool)
         self.__is_bus_ready_set_event = multiprocessing.Event()
@@ -96,7 +98,27 @@ class KolibriServiceContext(object):
         self.__kolibri_version_set_event = multiprocessing.Event()
 
     def push_has_changes(self):
-        self.__changed_event.set()
+        if not self.__is_updating:
+            self.__changed_event.set()
+
+    def update(self, **kwargs):
+        """
+        Set several properties at once, pushing one change notification after
+        all of them have been set instead of one for each property.
+        """
+
+        for name in kwargs.keys():
+            if not isinstance(getattr(type(self), name, None), property):
+                raise AttributeError(f"Unknown property '{name}'")
+
+        self.__is_updating = True
+        try:
+            for name, value in kwargs.items():
+                setattr(self, name, value)
+        finally:
+            self.__is_updating = False
+
+        self.push_has_changes()
 
     def pop_has_changes(self) -> bool:
         # TODO: It would be better to use a multiprocessing.Condition and wait()
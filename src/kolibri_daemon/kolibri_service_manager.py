@@ -32,7 +32,8 @@ class KolibriServiceManager(object):
         self.__http_process.start()
 
     def __send_command(self, command: KolibriHttpProcess.Command):
-        self.__command_tx.send(command)
+        # Commands are sent as raw bytes to avoid pickling them
+        self.__command_tx.send_bytes(bytes([command.value]))
 
     def start_kolibri(self):
         self.__send_command(KolibriHttpProcess.Command.START_KOLIBRI)
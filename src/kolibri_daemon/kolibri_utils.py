@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import filecmp
 import importlib.util
 import json
 import logging
 import os
 import shutil
+import sys
+import tempfile
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from gi.repository import GLib
+from kolibri_app.config import DAEMON_APPLICATION_ID
 from kolibri_app.config import KOLIBRI_HOME_TEMPLATE_DIR
+from kolibri_app.config import PROJECT_VERSION
 from kolibri_app.globals import KOLIBRI_HOME_PATH
+from kolibri_app.globals import KOLIBRI_HOME_POSIX
 
 from .content_extensions_manager import ContentExtensionsManager
 
@@ -31,6 +37,26 @@ OPTIONAL_PLUGINS = [
 
 # TODO: Automatically enable plugins from flatpak plugin extensions.
 
+# The list of available optional plugins is cached in this file, along with
+# details about sys.path, so we can avoid searching for them on every start:
+AVAILABLE_PLUGINS_CACHE_PATH = Path(
+    GLib.get_user_cache_dir(), DAEMON_APPLICATION_ID, "kolibri-daemon-plugins.json"
+)
+
+# These files in the Kolibri home template are ignored when deciding whether
+# Kolibri home has already been initialized:
+KOLIBRI_HOME_TEMPLATE_IGNORE = [
+    "logs",
+    "job_storage.sqlite3",
+]
+
+# This file is created in Kolibri home once it has been compared with the
+# Kolibri home template, so we can skip the comparison on later starts:
+KOLIBRI_HOME_TEMPLATE_SENTINEL = ".template_applied"
+
+# Maximum number of threads used to copy the Kolibri home template:
+KOLIBRI_HOME_TEMPLATE_COPY_THREADS = 4
+
 
 def init_kolibri(**kwargs):
     _kolibri_update_from_home_template()
@@ -39,11 +65,9 @@ def init_kolibri(**kwargs):
 
     from kolibri.utils.main import initialize
 
-    for plugin_name in REQUIRED_PLUGINS:
-        _enable_kolibri_plugin(plugin_name)
+    available_plugins = _get_available_plugins()
 
-    for plugin_name in OPTIONAL_PLUGINS:
-        _enable_kolibri_plugin(plugin_name, optional=True)
+    _enable_kolibri_plugins([*REQUIRED_PLUGINS, *available_plugins])
 
     initialize(**kwargs)
 
@@ -70,20 +94,107 @@ def _init_kolibri_env():
     content_extensions_manager.apply(os.environ)
 
 
-def _enable_kolibri_plugin(plugin_name: str, optional=False) -> bool:
+def _enable_kolibri_plugins(plugin_names: typing.List[str]):
     from kolibri.plugins import config as plugins_config
     from kolibri.plugins.registry import registered_plugins
     from kolibri.plugins.utils import enable_plugin
 
-    if optional and not importlib.util.find_spec(plugin_name):
-        return False
+    new_plugin_names = [
+        plugin_name
+        for plugin_name in plugin_names
+        if plugin_name not in plugins_config.ACTIVE_PLUGINS
+    ]
+
+    if not new_plugin_names:
+        return
 
-    if plugin_name not in plugins_config.ACTIVE_PLUGINS:
+    registered_plugins.register_plugins(new_plugin_names)
+
+    for plugin_name in new_plugin_names:
         logger.info(f"Enabling plugin {plugin_name}")
-        registered_plugins.register_plugins([plugin_name])
         enable_plugin(plugin_name)
 
-    return True
+
+def _get_available_plugins() -> typing.List[str]:
+    """
+    Returns the list of optional plugins which are available. This list only
+    changes when the application or its Python environment changes, so it is
+    cached between runs.
+    """
+
+    cache_key = _get_available_plugins_cache_key()
+
+    try:
+        cache_data = json.loads(AVAILABLE_PLUGINS_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        cache_data = {}
+
+    if _is_valid_available_plugins_cache(cache_data, cache_key):
+        return cache_data["plugins"]
+
+    available_plugins = [
+        plugin_name
+        for plugin_name in OPTIONAL_PLUGINS
+        if importlib.util.find_spec(plugin_name)
+    ]
+
+    try:
+        _write_json_atomic(
+            AVAILABLE_PLUGINS_CACHE_PATH,
+            {"key": cache_key, "plugins": available_plugins},
+        )
+    except OSError as error:
+        logger.warning(
+            f"Error writing '{AVAILABLE_PLUGINS_CACHE_PATH.as_posix()}': {error}"
+        )
+
+    return available_plugins
+
+
+def _is_valid_available_plugins_cache(cache_data: typing.Any, cache_key: dict) -> bool:
+    # The cache file may have been truncated or edited, so anything with an
+    # unexpected structure is treated as a cache miss.
+    if not isinstance(cache_data, dict) or cache_data.get("key") != cache_key:
+        return False
+
+    plugins = cache_data.get("plugins")
+
+    return isinstance(plugins, list) and all(
+        isinstance(plugin_name, str) for plugin_name in plugins
+    )
+
+
+def _get_available_plugins_cache_key() -> dict:
+    # Replacing a directory, such as when a flatpak is updated, changes its
+    # inode even if its modification time does not change.
+    path_stats = []
+
+    for path in sys.path:
+        try:
+            path_stat = os.stat(path or os.curdir)
+        except OSError:
+            continue
+        path_stats.append([path, path_stat.st_ino, path_stat.st_mtime_ns])
+
+    return {
+        "app_version": PROJECT_VERSION,
+        "python_version": sys.version,
+        "optional_plugins": OPTIONAL_PLUGINS,
+        "sys_path": path_stats,
+    }
+
+
+def _write_json_atomic(path: Path, data: typing.Any):
+    # Kolibri is initialized by more than one process at once, so the file is
+    # written to a temporary location and then moved into place.
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as out_file:
+        json.dump(data, out_file)
+
+    os.replace(out_file.name, path)
 
 
 def _get_automatic_provision_path() -> typing.Optional[Path]:
@@ -92,14 +203,13 @@ def _get_automatic_provision_path() -> typing.Optional[Path]:
     if not path.is_file():
         return None
 
-    with path.open("r") as in_file:
-        try:
-            data = json.load(in_file)
-        except json.JSONDecodeError as error:
-            logger.warning(
-                f"Error reading automatic provision data from '{path.as_posix()}': {error}"
-            )
-            return None
+    try:
+        data = json.loads(path.read_bytes())
+    except json.JSONDecodeError as error:
+        logger.warning(
+            f"Error reading automatic provision data from '{path.as_posix()}': {error}"
+        )
+        return None
 
     if not data.keys().isdisjoint(["facility", "superusername", "superuserpassword"]):
         # If a file has an attribute unique to the old format, we will asume it
@@ -122,27 +232,55 @@ def _kolibri_update_from_home_template():
     if not kolibri_home_template_dir.is_dir():
         return
 
+    sentinel_file = KOLIBRI_HOME_PATH.joinpath(KOLIBRI_HOME_TEMPLATE_SENTINEL)
+
+    if sentinel_file.exists():
+        return
+
     if not KOLIBRI_HOME_PATH.is_dir():
         KOLIBRI_HOME_PATH.mkdir(parents=True, exist_ok=True)
 
-    compare = filecmp.dircmp(
-        kolibri_home_template_dir,
-        KOLIBRI_HOME_PATH,
-        ignore=["logs", "job_storage.sqlite3"],
-    )
-
-    if len(compare.common) > 0:
+    with os.scandir(kolibri_home_template_dir) as template_dir_entries:
+        template_entries = {
+            entry.name: entry
+            for entry in template_dir_entries
+            if entry.name not in KOLIBRI_HOME_TEMPLATE_IGNORE
+        }
+
+    # We only need the names of the files in Kolibri home, so os.listdir is
+    # sufficient here.
+    if not template_entries.keys().isdisjoint(os.listdir(KOLIBRI_HOME_PATH)):
+        _touch_sentinel_file(sentinel_file)
         return
 
     # If Kolibri home was not already initialized, copy files from the
     # template directory to the new home directory.
 
-    logger.info(f"Copying KOLIBRI_HOME template to '{KOLIBRI_HOME_PATH.as_posix()}'")
+    logger.info(f"Copying KOLIBRI_HOME template to '{KOLIBRI_HOME_POSIX}'")
+
+    with ThreadPoolExecutor(max_workers=KOLIBRI_HOME_TEMPLATE_COPY_THREADS) as executor:
+        # Consume the results so any errors are raised here
+        list(executor.map(_copy_home_template_entry, template_entries.values()))
+
+    _touch_sentinel_file(sentinel_file)
+
+
+def _copy_home_template_entry(template_entry: os.DirEntry):
+    home_file = KOLIBRI_HOME_PATH.joinpath(template_entry.name)
+    # Kolibri does not care about the template files' metadata, so we use
+    # copyfile instead of copy2 to avoid copying it.
+    if template_entry.is_dir():
+        shutil.copytree(template_entry.path, home_file, copy_function=_copy_file_data)
+    else:
+        _copy_file_data(template_entry.path, home_file.as_posix())
+
+
+def _copy_file_data(src: str, dst: str) -> None:
+    shutil.copyfile(src, dst)
+
 
-    for filename in compare.left_only:
-        left_file = Path(compare.left, filename)
-        right_file = Path(compare.right, filename)
-        if left_file.is_dir():
-            shutil.copytree(left_file, right_file)
-        else:
-            shutil.copy2(left_file, right_file)
+def _touch_sentinel_file(path: Path):
+    try:
+        path.touch()
+    except OSError as error:
+        logger.warning(f"Error writing '{path.as_posix()}': {error}")